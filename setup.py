@@ -1,4 +1,14 @@
-from setuptools import setup, find_packages
+from setuptools import Extension, setup, find_packages
+
+try:
+    from Cython.Build import cythonize
+    # The module name is given explicitly, since the __init__.py at the repository root would make
+    # Cython prefix it with the name of the checkout directory
+    ext_modules = cythonize([Extension("src.properties._geo", ["src/properties/_geo.pyx"])])
+except ImportError:
+    # Cython is declared as a build requirement in pyproject.toml. Legacy builds without it
+    # skip the extension and the package falls back to pure Python implementations
+    ext_modules = []
 
 setup(
     name='REFinPy',
@@ -11,10 +21,15 @@ setup(
     url='https://github.com/juanpheusser/REFinPy',  
     license='MIT',
     packages=find_packages(), 
+    ext_modules=ext_modules,
     install_requires=[
         'numpy==1.26.4',
         'pandas==2.2.1',
     ],
+    extras_require={
+        # JIT-compiled kernels for scenario analysis and loan payments
+        'fast': ['numba>=0.59.1'],
+    },
     classifiers=[
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
@@ -0,0 +1 @@
+from ._numba_ops import pmt
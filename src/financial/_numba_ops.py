@@ -0,0 +1,148 @@
+import importlib.util
+
+import numpy as np
+
+# numba is optional, installed with `pip install REFinPy[fast]`. It is only imported on the first call that needs it,
+# so importing src.financial does not pay for loading numba
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+prange = range
+_compiled = False
+
+
+def _compile() -> None:
+  """
+  Imports numba and replaces the kernels of this module with their compiled versions. Does nothing after the first call.
+  """
+
+  global prange, _dcf_kernel, _pmt_scalar, _pmt_array, _compiled
+
+  if _compiled:
+    return
+
+  from numba import njit, prange
+
+  # numba resolves globals when a kernel is first called, so _pmt_array picks up the compiled _pmt_scalar and prange
+  _dcf_kernel = njit(parallel=True, cache=True)(_dcf_kernel)
+  _pmt_scalar = njit(cache=True)(_pmt_scalar)
+  _pmt_array = njit(parallel=True, cache=True)(_pmt_array)
+  _compiled = True
+
+
+def dcf_kernel(v: np.ndarray, vacancy_rates: np.ndarray,
+               gr: int, vac: int, egi: int, goe: int, tax: int, ins: int, pm: int, sr: int,
+               te: int, noi: int, ti: int, lc: int, cfbf: int, ds: int, cfaf: int) -> None:
+  """
+  Calculates Vacancy, Effective Gross Income, Total Expenses, Net Operating Income, Cash Flow Before Financing and
+  Cash Flow After Financing for a stack of scenarios in a single fused pass, in parallel across scenarios.
+  Element-wise version of the calculate_* functions of dcf_utils, which must be kept in sync with them.
+
+  Args:
+      v: Array of shape (n_scenarios, n_rows, n_years) with the DCF of each scenario. Modified in place.
+      vacancy_rates: Array of shape (n_scenarios, n_years) with the vacancy rate of each scenario and year.
+      gr, vac, egi, goe, tax, ins, pm, sr, te, noi, ti, lc, cfbf, ds, cfaf: Row positions of Gross Revenue, Vacancy,
+      Effective Gross Income, General Operating Expenses, Real Estate Taxes, Insurance, Property Management Fee,
+      Structural Reserve, Total Expenses, Net Operating Income, Tenant Improvements, Lease Commissions,
+      Cash Flow Before Financing, Debt Service and Cash Flow After Financing.
+
+  Returns:
+      None. The values are inserted directly into the array.
+  """
+
+  if NUMBA_AVAILABLE:
+    _compile()
+
+  _dcf_kernel(v, vacancy_rates, gr, vac, egi, goe, tax, ins, pm, sr, te, noi, ti, lc, cfbf, ds, cfaf)
+
+
+def _dcf_kernel(v, vacancy_rates, gr, vac, egi, goe, tax, ins, pm, sr, te, noi, ti, lc, cfbf, ds, cfaf):
+  """
+  Implementation of dcf_kernel, compiled by _compile.
+  """
+
+  n_scenarios, n_years = v.shape[0], v.shape[2]
+
+  for s in prange(n_scenarios):
+    for y in range(n_years):
+      vacancy = v[s, gr, y] * vacancy_rates[s, y]
+      v[s, vac, y] = vacancy
+
+      effective_gross_income = v[s, gr, y] - vacancy
+      v[s, egi, y] = effective_gross_income
+
+      total_expenses = v[s, goe, y] + v[s, tax, y] + v[s, ins, y] + v[s, pm, y] + v[s, sr, y]
+      v[s, te, y] = total_expenses
+
+      net_operating_income = effective_gross_income - total_expenses
+      v[s, noi, y] = net_operating_income
+
+      cash_flow_before_financing = net_operating_income - v[s, ti, y] - v[s, lc, y]
+      v[s, cfbf, y] = cash_flow_before_financing
+
+      v[s, cfaf, y] = cash_flow_before_financing - v[s, ds, y]
+
+
+def _pmt_scalar(rate: float, nper: float, pv: float, fv: float) -> float:
+  """
+  Calculates the payment of an annuity paid at the end of each period, for scalar arguments.
+  """
+
+  if rate == 0.0:
+    return -(fv + pv) / nper
+
+  temp = (1.0 + rate) ** nper
+  return -(fv + pv * temp) * rate / (temp - 1.0)
+
+
+def _pmt_array(rate: np.ndarray, nper: np.ndarray, pv: np.ndarray, fv: np.ndarray, out: np.ndarray) -> None:
+  """
+  Calculates the payment of an annuity paid at the end of each period, for 1D arrays of the same length.
+  """
+
+  for i in prange(rate.shape[0]):
+    out[i] = _pmt_scalar(rate[i], nper[i], pv[i], fv[i])
+
+
+def pmt(rate, nper, pv, fv=0.0):
+  """
+  Calculates the payment of a loan or annuity paid at the end of each period, following the sign convention of
+  numpy_financial.pmt (a positive present value gives a negative payment).
+
+  Args:
+      rate: The interest rate per period. A scalar or an array.
+      nper: The number of periods. A scalar or an array.
+      pv: The present value, e.g. the loan amount. A scalar or an array.
+      fv: The future value remaining after the last payment. A scalar or an array. Defaults to 0.
+
+  Returns:
+      The payment per period, as a float if every argument is a scalar, or as an array with the broadcast shape of the arguments otherwise.
+
+  Raises:
+      ValueError: If any number of periods is not positive.
+  """
+
+  if NUMBA_AVAILABLE:
+    _compile()
+
+  if np.isscalar(rate) and np.isscalar(nper) and np.isscalar(pv) and np.isscalar(fv):
+    if not nper > 0:
+      raise ValueError("nper must be positive")
+    return _pmt_scalar(float(rate), float(nper), float(pv), float(fv))
+
+  rate, nper, pv, fv = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (rate, nper, pv, fv)))
+
+  # Checked up front so the numba and numpy paths fail the same way instead of dividing by zero
+  if not np.all(nper > 0):
+    raise ValueError("nper must be positive")
+
+  if not NUMBA_AVAILABLE:
+    temp = (1.0 + rate) ** nper
+    zero_rate = rate == 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+      payment = -(fv + pv * temp) * rate / (temp - 1.0)
+    return np.where(zero_rate, -(fv + pv) / nper, payment)
+
+  out = np.empty(rate.size, dtype=np.float64)
+  _pmt_array(rate.ravel(), nper.ravel(), pv.ravel(), fv.ravel(), out)
+
+  return out.reshape(rate.shape)
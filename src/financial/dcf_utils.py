@@ -2,6 +2,27 @@ import pandas as pd
 import numpy as np
 from typing import Union
 
+from ._numba_ops import NUMBA_AVAILABLE, dcf_kernel, pmt
+
+# Rows used by calculate_scenarios, in the order expected by dcf_kernel
+_SCENARIO_ROWS = (
+  "Gross Revenue",
+  "Vacancy",
+  "Effective Gross Income",
+  "General Operating Expenses",
+  "Real Estate Taxes",
+  "Insurance",
+  "Property Management Fee",
+  "Structural Reserve",
+  "Total Expenses",
+  "Net Operating Income",
+  "Tenant Improvements",
+  "Lease Commissions",
+  "Cash Flow Before Financing",
+  "Debt Service",
+  "Cash Flow After Financing",
+)
+
 def create_dataframe(row_names: list[str], initial_year: int, num_years: int) -> pd.DataFrame:
   """
   Creates a pandas DataFrame with the given row names and columns representing consecutive years.
@@ -12,169 +33,420 @@ def create_dataframe(row_names: list[str], initial_year: int, num_years: int) ->
       num_years: An integer representing the number of years to include in the columns.
 
   Returns:
-      A pandas DataFrame with the specified row and column names.
+      A pandas float64 DataFrame with the specified row names and integer year columns, filled with NaN.
   """
 
-  # Create the list of column names
-  column_names = [str(year) for year in range(initial_year, initial_year + num_years)]
+  # Create the integer year columns
+  column_names = np.arange(initial_year, initial_year + num_years, dtype=np.int64)
+
+  # Preallocate the data as float64 so the DataFrame does not default to object dtype
+  data = np.full((len(row_names), num_years), np.nan, dtype=np.float64)
 
   # Create the DataFrame
-  dcf = pd.DataFrame(columns=column_names, index=row_names)
+  dcf = pd.DataFrame(data, columns=column_names, index=row_names, copy=False)
 
   return dcf
 
 
-def insert_data_into_row(dcf: pd.DataFrame, row_name: str, data: Union[list[float], pd.Series]) -> None:
+class DCFModel:
+  """
+  Represents a Discounted Cashflow Model backed by a single 2D NumPy array of shape (rows, years).
+  """
+
+  def __init__(self, row_names: list[str], columns: list, values: np.ndarray = None, copy: bool = True):
+    """
+    Initializes a DCFModel object.
+
+    Args:
+        row_names: A list of strings representing the names of the rows.
+        columns: A list with the column labels (years) of the model.
+        values: Optional array of shape (len(row_names), len(columns)) with the initial data. Defaults to NaN.
+        copy: If False, a float64 values array is used directly instead of being copied. Defaults to True.
+
+    Raises:
+        ValueError: If the shape of the values does not match the row names and columns.
+    """
+
+    self.row_names = list(row_names)
+    self.columns = list(columns)
+    self.row_idx = {row_name: i for i, row_name in enumerate(self.row_names)}
+
+    shape = (len(self.row_names), len(self.columns))
+
+    if values is None:
+      values = np.full(shape, np.nan, dtype=np.float64)
+    else:
+      values = np.array(values, dtype=np.float64) if copy else np.asarray(values, dtype=np.float64)
+      if values.shape != shape:
+        raise ValueError(f"The values must have shape {shape}, got {values.shape}")
+
+    self.values = values
+
+  def copy(self) -> "DCFModel":
+    """
+    Creates a copy of the model with its own data.
+
+    The row names, columns and row positions are shared with the original, since they are never modified,
+    which makes copying a template model cheap when building many scenarios.
+
+    Returns:
+        A new DCFModel with a copy of the data.
+    """
+
+    return self._from_parts(self.row_names, self.columns, self.row_idx, self.values.copy())
+
+  @classmethod
+  def _from_parts(cls, row_names: list[str], columns: list, row_idx: dict[str, int], values: np.ndarray) -> "DCFModel":
+    """
+    Creates a DCFModel from already built attributes, without validating or copying them.
+    """
+
+    dcf = object.__new__(cls)
+    dcf.row_names = row_names
+    dcf.columns = columns
+    dcf.row_idx = row_idx
+    dcf.values = values
+
+    return dcf
+
+  @classmethod
+  def from_dataframe(cls, dcf: pd.DataFrame) -> "DCFModel":
+    """
+    Creates a DCFModel from a pandas DataFrame.
+
+    Args:
+        dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+
+    Returns:
+        A DCFModel with the same rows, columns and data as the DataFrame.
+    """
+
+    return cls(dcf.index, dcf.columns, dcf.to_numpy(dtype=np.float64, copy=True), copy=False)
+
+  def to_dataframe(self) -> pd.DataFrame:
+    """
+    Wraps the model data in a pandas DataFrame.
+
+    Returns:
+        A pandas DataFrame with the row names as index and the years as columns.
+    """
+
+    return pd.DataFrame(self.values, index=self.row_names, columns=self.columns, copy=False)
+
+
+def _require_model(dcf) -> None:
   """
-  Inserts a list of data into the specified row of a pandas DataFrame.
+  Checks that the calculations receive a DCFModel, since they write their results into its array.
+
+  Raises:
+      TypeError: If dcf is not a DCFModel.
+  """
+
+  if not isinstance(dcf, DCFModel):
+    raise TypeError(f"dcf must be a DCFModel, got {type(dcf).__name__}. Convert DataFrames with DCFModel.from_dataframe")
+
+def insert_data_into_row(dcf: Union[DCFModel, pd.DataFrame], row_name: str, data: Union[list[float], np.ndarray, pd.Series]) -> None:
+  """
+  Inserts a list of data into the specified row of a DCFModel or a pandas DataFrame.
+
+  The data is written by position, in column order, without aligning it to the column labels.
 
   Args:
-      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      dcf: The DCFModel or pandas DataFrame containing the Discounted Cashflow Model.
       row_name: The name of the row to insert the data into.
       data: A list of data to insert.
 
   Returns:
-      None. The data is inserted directly into the DataFrame.
+      None. The data is inserted directly into the model.
   """
 
   # Check if the length of the data matches the number of columns
   if len(data) != len(dcf.columns):
-    raise ValueError("The length of the data must match the number of columns in the DataFrame.")
+    raise ValueError("The length of the data must match the number of columns in the model.")
 
   # Insert the data into the specified row
-  dcf.loc[row_name] = data
+  if isinstance(dcf, DCFModel):
+    dcf.values[dcf.row_idx[row_name], :] = np.asarray(data, dtype=dcf.values.dtype)
+  else:
+    dcf.iloc[dcf.index.get_loc(row_name), :] = np.asarray(data, dtype=np.float64)
 
-def calculate_vacancy(dcf: pd.DataFrame, rates: pd.DataFrame) -> None:
+def _get_row(dcf: Union[DCFModel, pd.DataFrame], row_name: str, columns: list) -> np.ndarray:
+  """
+  Gets a row of a DCFModel or a pandas DataFrame as a NumPy array, checking that its columns match.
+
+  Args:
+      dcf: The DCFModel or pandas DataFrame containing the row.
+      row_name: The name of the row.
+      columns: The column labels (years) the row must have, e.g. the columns of the model it is combined with.
+
+  Returns:
+      A float64 NumPy array with the values of the row. For a DCFModel it is a view of the model data.
+
+  Raises:
+      ValueError: If the columns of dcf do not match the given columns.
+  """
+
+  # The row is used by position, so the years must line up before dropping the labels
+  if list(dcf.columns) != list(columns):
+    raise ValueError(f"The columns of the '{row_name}' row do not match the columns of the model")
+
+  if isinstance(dcf, DCFModel):
+    return dcf.values[dcf.row_idx[row_name]]
+
+  # Drop to the underlying array so arithmetic skips pandas index alignment
+  return dcf.loc[row_name].to_numpy(dtype=np.float64)
+
+def calculate_vacancy(dcf: DCFModel, rates: Union[DCFModel, pd.DataFrame]) -> None:
   """
   Calculates vacancy by multiplying the Gross Revenue by the Vacancy Rate and inserts the result into the Vacancy row.
 
   Args:
-      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      dcf: The DCFModel containing the Discounted Cashflow Model.
+      rates: The DCFModel or pandas DataFrame containing the rates, including the Vacancy Rate row, with the same columns as dcf.
 
   Returns:
-      None. The vacancy values are inserted directly into the DataFrame.
+      None. The vacancy values are inserted directly into the model.
+
+  Raises:
+      ValueError: If the columns of the rates do not match the columns of dcf.
   """
 
-  # Get the Gross Revenue and Vacancy Rate rows
-  gross_revenue = dcf.loc["Gross Revenue"]
-  vacancy_rate = rates.loc["Vacancy Rate"]
+  _require_model(dcf)
 
-  # Multiply the two rows to get vacancy
-  vacancy = gross_revenue * vacancy_rate
+  v = dcf.values
+  ri = dcf.row_idx
 
-  # Insert the vacancy values into the Vacancy row
-  insert_data_into_row(dcf, "Vacancy", vacancy)
+  # Multiply the Gross Revenue and Vacancy Rate rows, writing directly into the Vacancy row
+  np.multiply(v[ri["Gross Revenue"]], _get_row(rates, "Vacancy Rate", dcf.columns), out=v[ri["Vacancy"]])
 
 
-def calculate_effective_gross_income(dcf: pd.DataFrame) -> None:
+def calculate_effective_gross_income(dcf: DCFModel) -> None:
   """
   Calculates the effective gross income by subtracting Vacancy from Gross Revenue and inserts the result into the Effective Gross Income row.
 
   Args:
-      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      dcf: The DCFModel containing the Discounted Cashflow Model.
 
   Returns:
-      None. The effective gross income values are inserted directly into the DataFrame.
+      None. The effective gross income values are inserted directly into the model.
   """
 
-  # Get the Gross Revenue and Vacancy rows
-  gross_revenue = dcf.loc["Gross Revenue"]
-  vacancy = dcf.loc["Vacancy"]
+  _require_model(dcf)
 
-  # Calculate the effective gross income
-  effective_gross_income = gross_revenue - vacancy
+  v = dcf.values
+  ri = dcf.row_idx
 
-  # Insert the effective gross income values into the Effective Gross Income row
-  insert_data_into_row(dcf, "Effective Gross Income", effective_gross_income)
+  # Subtract the Vacancy row from the Gross Revenue row, writing directly into the destination row
+  np.subtract(v[ri["Gross Revenue"]], v[ri["Vacancy"]], out=v[ri["Effective Gross Income"]])
 
-def calculate_total_expenses(dcf: pd.DataFrame) -> None:
+def calculate_total_expenses(dcf: DCFModel) -> None:
   """
   Calculates the total expenses by adding General Operating Expenses, Real Estate Taxes, Insurance, Property Management Fees and Structural Reserve and inserts the result into the Total Expense row.
 
   Args:
-      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      dcf: The DCFModel containing the Discounted Cashflow Model.
 
   Returns:
-      None. The total expenses values are inserted directly into the DataFrame.
+      None. The total expenses values are inserted directly into the model.
   """
 
-  # Get the necessary rows
-  general_operating_expenses = dcf.loc["General Operating Expenses"]
-  real_estate_taxes = dcf.loc["Real Estate Taxes"]
-  insurance = dcf.loc["Insurance"]
-  property_management_fee = dcf.loc["Property Management Fee"]
-  structural_reserve = dcf.loc["Structural Reserve"]
+  _require_model(dcf)
+  _total_expenses(dcf.values, dcf.row_idx)
 
-  # Calculate the total expenses
-  total_expenses = general_operating_expenses + real_estate_taxes + insurance + property_management_fee + structural_reserve
+def _total_expenses(v: np.ndarray, ri: dict[str, int]) -> None:
+  """
+  Row operation of calculate_total_expenses, on the values and row positions of an already validated model.
+  """
 
-  # Insert the total expenses values into the Total Expense row
-  insert_data_into_row(dcf, "Total Expenses", total_expenses)
+  # Add the expense rows, accumulating in the destination row
+  total_expenses = v[ri["Total Expenses"]]
+  np.add(v[ri["General Operating Expenses"]], v[ri["Real Estate Taxes"]], out=total_expenses)
+  total_expenses += v[ri["Insurance"]]
+  total_expenses += v[ri["Property Management Fee"]]
+  total_expenses += v[ri["Structural Reserve"]]
 
-def calculate_net_operating_income(dcf: pd.DataFrame) -> None:
+def calculate_net_operating_income(dcf: DCFModel) -> None:
   """
   Calculates the net operating income by subtracting Total Expenses from Effective Gross Income and inserts the result into the Net Operating Income row.
 
   Args:
-      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      dcf: The DCFModel containing the Discounted Cashflow Model.
 
   Returns:
-      None. The net operating income values are inserted directly into the DataFrame.
+      None. The net operating income values are inserted directly into the model.
   """
 
-  # Get the Effective Gross Income and Total Expenses rows
-  effective_gross_income = dcf.loc["Effective Gross Income"]
-  total_expenses = dcf.loc["Total Expenses"]
+  _require_model(dcf)
+  _net_operating_income(dcf.values, dcf.row_idx)
 
-  # Calculate the net operating income
-  net_operating_income = effective_gross_income - total_expenses
+def _net_operating_income(v: np.ndarray, ri: dict[str, int]) -> None:
+  """
+  Row operation of calculate_net_operating_income, on the values and row positions of an already validated model.
+  """
 
-  # Insert the net operating income values into the Net Operating Income row
-  insert_data_into_row(dcf, "Net Operating Income", net_operating_income)
+  # Subtract the Total Expenses row from the Effective Gross Income row, writing directly into the destination row
+  np.subtract(v[ri["Effective Gross Income"]], v[ri["Total Expenses"]], out=v[ri["Net Operating Income"]])
 
 
-def calculate_cash_flow_before_financing(dcf: pd.DataFrame) -> None:
+def calculate_cash_flow_before_financing(dcf: DCFModel) -> None:
   """
   Calculates the cash flow before financing by subtracting Tenant Improvements and Lease Commissions from Net Operating Income and inserts the result into the Cash Flow Before Financing row.
 
   Args:
-      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      dcf: The DCFModel containing the Discounted Cashflow Model.
 
   Returns:
-      None. The cash flow before financing values are inserted directly into the DataFrame.
+      None. The cash flow before financing values are inserted directly into the model.
   """
 
-  # Get the Net Operating Income, Tenant Improvements, and Lease Commissions rows
-  net_operating_income = dcf.loc["Net Operating Income"]
-  tenant_improvements = dcf.loc["Tenant Improvements"]
-  lease_commissions = dcf.loc["Lease Commissions"]
+  _require_model(dcf)
+  _cash_flow_before_financing(dcf.values, dcf.row_idx)
 
-  # Calculate the cash flow before financing
-  cash_flow_before_financing = net_operating_income - tenant_improvements - lease_commissions
+def _cash_flow_before_financing(v: np.ndarray, ri: dict[str, int]) -> None:
+  """
+  Row operation of calculate_cash_flow_before_financing, on the values and row positions of an already validated model.
+  """
 
-  # Insert the cash flow before financing values into the Cash Flow Before Financing row
-  insert_data_into_row(dcf, "Cash Flow Before Financing", cash_flow_before_financing)
+  # Subtract the Tenant Improvements and Lease Commissions rows from the Net Operating Income row, writing directly into the destination row
+  cash_flow_before_financing = v[ri["Cash Flow Before Financing"]]
+  np.subtract(v[ri["Net Operating Income"]], v[ri["Tenant Improvements"]], out=cash_flow_before_financing)
+  cash_flow_before_financing -= v[ri["Lease Commissions"]]
 
-def calculate_cash_flow_after_financing(dcf: pd.DataFrame) -> None:
+def calculate_debt_service(dcf: DCFModel, loan_amount: float, interest_rate: float, amortization_years: int, payments_per_year: int = 12) -> None:
+  """
+  Calculates the yearly debt service of a fully amortizing loan and inserts the result into the Debt Service row.
+
+  Args:
+      dcf: The DCFModel containing the Discounted Cashflow Model.
+      loan_amount: The principal of the loan.
+      interest_rate: The annual interest rate of the loan, e.g. 0.05 for 5%.
+      amortization_years: The number of years over which the loan is repaid. Years after it have no debt service.
+      payments_per_year: The number of payments made each year. Defaults to 12 (monthly payments).
+
+  Returns:
+      None. The debt service values are inserted directly into the model.
+
+  Raises:
+      TypeError: If the loan amount or interest rate is not a scalar, or the amortization years or payments per year
+          are not integers.
+      ValueError: If the amortization years are negative or the payments per year are not positive.
+  """
+
+  _require_model(dcf)
+
+  if not np.isscalar(loan_amount):
+    raise TypeError("loan_amount must be a scalar. Use pmt directly for arrays of loan amounts, e.g. one per scenario")
+  if not np.isscalar(interest_rate):
+    raise TypeError("interest_rate must be a scalar. Use pmt directly for arrays of rates, e.g. one per scenario")
+  if isinstance(amortization_years, bool) or not isinstance(amortization_years, (int, np.integer)):
+    raise TypeError("amortization_years must be an integer")
+  if amortization_years < 0:
+    raise ValueError("amortization_years must not be negative")
+  if isinstance(payments_per_year, bool) or not isinstance(payments_per_year, (int, np.integer)):
+    raise TypeError("payments_per_year must be an integer")
+  if payments_per_year <= 0:
+    raise ValueError("payments_per_year must be positive")
+
+  row = dcf.values[dcf.row_idx["Debt Service"]]
+  row[:] = 0.0
+
+  if amortization_years == 0:
+    return
+
+  # Yearly total of the periodic payments, as a positive amount
+  row[:amortization_years] = -pmt(interest_rate / payments_per_year, amortization_years * payments_per_year, loan_amount) * payments_per_year
+
+def calculate_cash_flow_after_financing(dcf: DCFModel) -> None:
   """
   Calculates the cash flow after financing by subtracting Debt Service from Cash Flow Before Financing and inserts the result into the Cash Flow After Financing row.
 
   Args:
-      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      dcf: The DCFModel containing the Discounted Cashflow Model.
+
+  Returns:
+      None. The cash flow after financing values are inserted directly into the model.
+  """
+
+  _require_model(dcf)
+  _cash_flow_after_financing(dcf.values, dcf.row_idx)
+
+def _cash_flow_after_financing(v: np.ndarray, ri: dict[str, int]) -> None:
+  """
+  Row operation of calculate_cash_flow_after_financing, on the values and row positions of an already validated model.
+  """
+
+  # Subtract the Debt Service row from the Cash Flow Before Financing row, writing directly into the destination row
+  np.subtract(v[ri["Cash Flow Before Financing"]], v[ri["Debt Service"]], out=v[ri["Cash Flow After Financing"]])
+
+
+def calculate_bottom_lines(dcf: DCFModel) -> None:
+  """
+  Calculates Total Expenses, Net Operating Income, Cash Flow Before Financing and Cash Flow After Financing.
+
+  Gives the same result as calling calculate_total_expenses, calculate_net_operating_income,
+  calculate_cash_flow_before_financing and calculate_cash_flow_after_financing in order, but checks the model only once.
+
+  Args:
+      dcf: The DCFModel containing the Discounted Cashflow Model.
+
+  Returns:
+      None. The values are inserted directly into the model.
+  """
+
+  _require_model(dcf)
+
+  v = dcf.values
+  ri = dcf.row_idx
+
+  _total_expenses(v, ri)
+  _net_operating_income(v, ri)
+  _cash_flow_before_financing(v, ri)
+  _cash_flow_after_financing(v, ri)
+
+
+def calculate_scenarios(values: np.ndarray, row_idx: dict[str, int], vacancy_rates: np.ndarray) -> None:
+  """
+  Calculates the DCF, from Vacancy down to Cash Flow After Financing, for a stack of scenarios sharing the same rows.
+
+  Uses a parallel numba kernel when numba is installed. Otherwise runs the calculate_* functions on a view of all the
+  scenarios at once.
+
+  Args:
+      values: Array of shape (n_scenarios, n_rows, n_years) with the DCF of each scenario. Modified in place.
+      row_idx: A dictionary mapping each row name to its position, e.g. DCFModel.row_idx.
+      vacancy_rates: Array of shape (n_scenarios, n_years) with the vacancy rate of each scenario and year.
 
   Returns:
-      None. The cash flow after financing values are inserted directly into the DataFrame.
+      None. The values are inserted directly into the array.
+
+  Raises:
+      ValueError: If the arrays do not have the expected shapes or dtype, or a row position is outside values.
   """
 
-  # Get the Cash Flow Before Financing and Debt Service rows
-  cash_flow_before_financing = dcf.loc["Cash Flow Before Financing"]
-  debt_service = dcf.loc["Debt Service"]
+  if values.ndim != 3 or values.dtype != np.float64:
+    raise ValueError("values must be a float64 array of shape (n_scenarios, n_rows, n_years)")
+
+  vacancy_rates = np.ascontiguousarray(vacancy_rates, dtype=np.float64)
+  if vacancy_rates.shape != (values.shape[0], values.shape[2]):
+    raise ValueError("vacancy_rates must have shape (n_scenarios, n_years)")
 
-  # Calculate the cash flow after financing
-  cash_flow_after_financing = cash_flow_before_financing - debt_service
+  rows = tuple(row_idx[row_name] for row_name in _SCENARIO_ROWS)
+  # The kernel does not bounds-check, so an out-of-range position would read or write outside the array
+  if min(rows) < 0 or max(rows) >= values.shape[1]:
+    raise ValueError("row_idx positions must be within the rows of values")
 
-  # Insert the cash flow after financing values into the Cash Flow After Financing row
-  insert_data_into_row(dcf, "Cash Flow After Financing", cash_flow_after_financing)
+  if NUMBA_AVAILABLE:
+    dcf_kernel(values, vacancy_rates, *rows)
+    return
+
+  # Run the regular helpers on a (n_rows, n_scenarios, n_years) view, so each row covers every scenario at once
+  columns = list(range(values.shape[2]))
+  dcf = DCFModel._from_parts(list(row_idx), columns, row_idx, values.transpose(1, 0, 2))
+  rates = DCFModel._from_parts(["Vacancy Rate"], columns, {"Vacancy Rate": 0}, vacancy_rates[None])
+
+  calculate_vacancy(dcf, rates)
+  calculate_effective_gross_income(dcf)
+  calculate_bottom_lines(dcf)
 
 
 def insert_data_by_year(dcf: pd.DataFrame, data: dict) -> None:
@@ -189,32 +461,70 @@ def insert_data_by_year(dcf: pd.DataFrame, data: dict) -> None:
       None. The data is inserted directly into the DataFrame.
   """
 
-  # Get the year from the data dictionary
-  year = data['year']
+  _insert_data_by_year(dcf, data)
 
-  # Iterate over each key-value pair in the data dictionary
-  for key, value in data.items():
-    # Skip the 'year' key
-    if key != 'year':
-      # Insert the data into the DataFrame
-      dcf.loc[key, year] = value
+def _position_map(labels: pd.Index) -> dict:
+  """
+  Maps each label of a pandas Index to its integer position.
+  """
+
+  return {label: i for i, label in enumerate(labels)}
+
+def _insert_data_by_year(dcf: pd.DataFrame, data: dict, row_pos: dict = None, col_pos: dict = None) -> None:
+  """
+  Inserts the data for one year with a single columnar assignment.
+
+  Args:
+      dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      data: A dictionary with an integer 'year' key and one key-value pair per row to insert.
+      row_pos: Optional dictionary mapping each row name to its position. If None, the positions are resolved with the DataFrame index.
+      col_pos: Optional dictionary mapping each column name to its position. If None, the positions are resolved with the DataFrame columns.
+
+  Raises:
+      KeyError: If the year or any of the row names are not in the DataFrame.
+  """
 
-def replicate_first_column(dcf: pd.DataFrame) -> pd.DataFrame:
+  # Get the column of the year from the data dictionary
+  year = data['year']
+  year_col = dcf.columns.get_loc(year) if col_pos is None else col_pos[year]
+
+  # Collect the row positions and values, skipping the 'year' key
+  keys = [key for key in data if key != 'year']
+  if row_pos is None:
+    row_positions = dcf.index.get_indexer(keys)
+    if (row_positions < 0).any():
+      raise KeyError([key for key, pos in zip(keys, row_positions) if pos < 0])
+  else:
+    row_positions = [row_pos[key] for key in keys]
+  values = np.fromiter((data[key] for key in keys), dtype=np.float64, count=len(keys))
+
+  # Insert all the values of the year at once
+  dcf.iloc[row_positions, year_col] = values
+
+def replicate_first_column(dcf: pd.DataFrame, writeable: bool = True) -> pd.DataFrame:
   """
   Replicates the first column of the DataFrame into every other column.
 
   Args:
       dcf: The pandas DataFrame containing the Discounted Cashflow Model.
+      writeable: If False, the new DataFrame is backed by a read-only broadcast view of the first column instead of a copy.
+      Use it when the result is only read, e.g. before passing it to DCFModel.from_dataframe. Defaults to True.
 
   Returns:
       A new DataFrame with the first column replicated into every other column.
   """
 
   # Get the first column
-  first_column = dcf.iloc[:, 0]
+  first_column = dcf.iloc[:, 0].to_numpy()
 
-  # Create a new DataFrame with the first column replicated into every other column
-  new_df = pd.DataFrame(np.tile(first_column.values, (len(dcf.columns), 1)).T, columns=dcf.columns, index=dcf.index)
+  # Broadcast the first column across every column without copying it
+  values = np.broadcast_to(first_column[:, None], (first_column.shape[0], len(dcf.columns)))
+
+  # Only materialize the data if the new DataFrame may be modified
+  if writeable:
+    values = np.ascontiguousarray(values)
+
+  new_df = pd.DataFrame(values, columns=dcf.columns, index=dcf.index, copy=False)
 
   return new_df
 
@@ -230,7 +540,11 @@ def insert_data_from_dict_list(dcf: pd.DataFrame, data_list: list[dict]) -> None
       None. The data is inserted directly into the DataFrame.
   """
 
+  # Resolve the row and column positions once for the whole list
+  row_pos = _position_map(dcf.index)
+  col_pos = _position_map(dcf.columns)
+
   # Iterate over each dictionary in the list
   for data in data_list:
-    # Call the insert_data_by_year function to insert the data
-    insert_data_by_year(dcf, data)
\ No newline at end of file
+    # Insert the data of each year
+    _insert_data_by_year(dcf, data, row_pos, col_pos)
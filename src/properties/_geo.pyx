@@ -0,0 +1,18 @@
+# cython: language_level=3
+
+cpdef bint lonlat_oob(double lat, double lon) noexcept nogil:
+    """
+    Checks whether a (latitude, longitude) pair is outside the valid range.
+
+    Uses non short-circuiting comparisons on C doubles, so the check is branchless. NaN values are
+    reported as out of bounds.
+
+    Args:
+        lat (float): The latitude in degrees.
+        lon (float): The longitude in degrees.
+
+    Returns:
+        bool: True if the latitude is outside [-90, 90] or the longitude is outside [-180, 180].
+    """
+
+    return not ((lat >= -90.0) & (lat <= 90.0) & (lon >= -180.0) & (lon <= 180.0))
@@ -1,11 +1,103 @@
-from typing import Union
+from collections.abc import Mapping, Sized
+from typing import Iterable, Union
+
+import numpy as np
+
+def _lonlat_oob_py(lat: float, lon: float) -> bool:
+    """
+    Pure Python version of _geo.lonlat_oob, used when the Cython extension has not been built.
+
+    Converts the values to float like the extension converts them to C doubles, so values too large
+    for a float raise OverflowError on both paths.
+    """
+
+    lat = float(lat)
+    lon = float(lon)
+    return not (-90 <= lat <= 90 and -180 <= lon <= 180)
+
+try:
+    from ._geo import lonlat_oob
+except ImportError:
+    lonlat_oob = _lonlat_oob_py
+
+# Valid keys of a dictionary address and the expected type of each value
+_VALID_ADDRESS_KEYS: dict[str, type] = {
+    "street_number": int,
+    "street_name": str,
+    "unit_number": int,
+    "city": str,
+    "state": str,
+    "province": str,
+    "region": str,
+    "zip_code": str,
+    "country": str
+}
+
+# Types accepted for the latitude and longitude of a location
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+
+def _validate_address(address):
+    """
+    Validates a single address with the same rules as Property.__init__.
+
+    Args:
+        address: The proposed address value.
+
+    Raises:
+        TypeError: If the address is not a string, dictionary or None.
+        ValueError: If the address dictionary has invalid keys or value types.
+    """
+
+    if address is None or isinstance(address, str):
+        return
+    if not isinstance(address, dict):
+        raise TypeError("Address must be either a string or a dictionary")
+
+    for key, value in address.items():
+        expected_type = _VALID_ADDRESS_KEYS.get(key)
+        if expected_type is None:
+            raise ValueError(f"Address dictionary contains invalid key '{key}'")
+        if not isinstance(value, expected_type):
+            raise ValueError(f"Invalid type for address key '{key}'. Expected: {expected_type}, got {type(value)}")
+
+class _AddressProxy(Mapping):
+    """
+    Read-only view of a dictionary address that is only validated the first time it is accessed.
+    """
+    __slots__ = ("_raw", "_parsed")
+
+    def __init__(self, raw: dict):
+        self._raw = raw
+        self._parsed = None
+
+    def _parse(self) -> dict:
+        if self._parsed is None:
+            _validate_address(self._raw)
+            self._parsed = self._raw
+        return self._parsed
+
+    def __getitem__(self, key):
+        return self._parse()[key]
+
+    def __iter__(self):
+        return iter(self._parse())
+
+    def __len__(self):
+        return len(self._parse())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._raw!r})"
+
 
 class Property:
     """
     Represents a generic real estate property and its basic information
     """
-    def __init__(self, name: str = None, address: Union[str, dict] = None, location: tuple[float, float] = None):
-        
+    __slots__ = ("name", "address", "location")
+
+    def __init__(self, name: str = None, address: Union[str, dict] = None, location: tuple[float, float] = None,
+                 _skip_validation: bool = False):
+
         """
         Initializes a Property object.
 
@@ -27,113 +119,165 @@ class Property:
                     }
 
             location (float, optional): A tuple containing the (latitude, longitude) of the property.
+            _skip_validation (bool, optional): Internal flag used by from_arrays, which has already
+            validated the addresses and locations in bulk. Defaults to False.
         """
 
-        self._validate_and_assign(name, "name", str)
-        self._validate_and_assign_address(address)
-        self._validate_and_assign_location(location)
+        # The checks are inlined instead of going through per-attribute method calls, since the address
+        # schema and location bounds are fixed
+        if name is not None and not isinstance(name, str):
+            raise TypeError(f"name must be of type {str}")
+        self.name = name
 
+        if _skip_validation:
+            self.address = address
+            self.location = location
+            return
 
-    def _validate_and_assign(self, value, name, expected_type, positive=False):
-        """
-        Validates the given value and assigns it to the corresponding attribute.
+        if address is None or isinstance(address, str):
+            self.address = address
+        elif isinstance(address, dict):
+            for key, value in address.items():
+                expected_type = _VALID_ADDRESS_KEYS.get(key)
+                if expected_type is None:
+                    raise ValueError(f"Address dictionary contains invalid key '{key}'")
+                if not isinstance(value, expected_type):
+                    raise ValueError(f"Invalid type for address key '{key}'. Expected: {expected_type}, got {type(value)}")
+            self.address = address
+        else:
+            raise TypeError("Address must be either a string or a dictionary")
 
-        Args:
-            value: The value to be assigned to the attribute.
-            name (str): The name of the attribute.
-            expected_type (type): The expected data type of the value.
-            positive (bool, optional): If True, enforces that the value must be positive. Defaults to False.
+        if location is None:
+            self.location = None
+            return
 
-        Raises:
-            TypeError: If the value is not of the expected type.
-            ValueError: If the 'positive' flag is set and the value is not positive.
-        """
+        if not isinstance(location, tuple) or len(location) != 2:
+            raise TypeError("Location must be a tuple of length 2 containing numeric values")
 
-        if not isinstance(value, expected_type) and value is not None:
-            raise TypeError(f"{name} must be of type {expected_type}")
-        if positive and value <= 0:
-            raise ValueError(f"{name} must be positive")
-        setattr(self, name, value)
+        lat, lon = location
+        if not (isinstance(lat, _NUMERIC_TYPES) and isinstance(lon, _NUMERIC_TYPES)):
+            raise TypeError("Location tuple must contain two numeric values")
+
+        # Also rejects NaN, infinite and values too large for a float
+        try:
+            out_of_bounds = lonlat_oob(lat, lon)
+        except OverflowError:
+            out_of_bounds = True
+
+        if out_of_bounds:
+            if not (-90 <= lat <= 90):
+                raise ValueError("Invalid latitude. Must be between -90 and 90 degrees")
+            raise ValueError("Invalid longitude. Must be between -180 and 180 degrees")
+
+        self.location = (float(lat), float(lon))
 
 
-    def _validate_and_assign_location(self, location: tuple[float, float]):
+    @classmethod
+    def from_arrays(cls, names: Iterable[str], addresses: Iterable[Union[str, dict]], lats: Iterable[float], lons: Iterable[float],
+                    lazy_addresses: bool = False) -> list["Property"]:
         """
-        Validates the location attribute and assigns it if all checks pass.
+        Creates multiple properties at once, validating all the addresses and locations in bulk.
 
         Args:
-            location: The proposed location value.
+            names (iterable of str): The names of the properties.
+            addresses (iterable of str or dict): The addresses of the properties. Can be None if no addresses are given.
+            lats (array-like of float): The latitudes of the properties.
+            lons (array-like of float): The longitudes of the properties.
+            lazy_addresses (bool, optional): If True, dictionary addresses are not validated upfront. They are
+            wrapped in a read-only mapping that validates them the first time they are accessed, which raises
+            the ValueError at that point instead. Useful for large loads where most addresses are never read.
+            Defaults to False.
+
+        Returns:
+            list: A list with one property per element of the input arrays.
 
         Raises:
-            TypeError: If the location is not a tuple of length 2 or doesn't contain numeric values.
-            ValueError: If the latitude or longitude values are outside the valid range.
+            TypeError: If an address is not a string or dictionary, or the latitudes or longitudes are not numeric.
+            ValueError: If the inputs have different lengths, an address is invalid or any latitude or
+            longitude is outside the valid range.
         """
 
-        if location is None:
-            self.location = None  # Assign None if location is optional
-            return  # Exit the function early since no further validation is needed
+        lats = np.asarray(lats)
+        lons = np.asarray(lons)
 
-        if not isinstance(location, tuple) or len(location) != 2:
-            raise TypeError("Location must be a tuple of length 2 containing numeric values")
+        # Only accept numeric input, like the constructor does, instead of letting NumPy parse strings
+        if lats.dtype.kind not in "biuf" or lons.dtype.kind not in "biuf":
+            raise TypeError("lats and lons must contain numeric values")
 
-        try:
-            lat, lon = location
-            lat = float(lat)  # Ensure conversion to float succeeds
-            lon = float(lon)  # Ensure conversion to float succeeds
-        except ValueError:
-            raise TypeError("Location tuple must contain two numeric values")
+        lats = lats.astype(np.float64, copy=False)
+        lons = lons.astype(np.float64, copy=False)
 
-        if not (-90 <= lat <= 90):
+        # Only iterators need to be materialized to check the lengths
+        if not isinstance(names, Sized):
+            names = list(names)
+        if addresses is None:
+            addresses = [None] * len(names)
+        elif lazy_addresses:
+            addresses = [_AddressProxy(address) if type(address) is dict else address for address in addresses]
+        elif not isinstance(addresses, Sized):
+            addresses = list(addresses)
+
+        if lats.ndim != 1 or lats.shape != lons.shape or not (len(names) == len(addresses) == len(lats)):
+            raise ValueError("names, addresses, lats and lons must be one dimensional and have the same length")
+
+        # The negated comparisons also reject NaN values
+        if np.any(~(np.abs(lats) <= 90)):
             raise ValueError("Invalid latitude. Must be between -90 and 90 degrees")
-        if not (-180 <= lon <= 180):
+        if np.any(~(np.abs(lons) <= 180)):
             raise ValueError("Invalid longitude. Must be between -180 and 180 degrees")
 
-        # All checks passed, assign the validated location
-        self.location = (lat, lon)
+        cls.validate_addresses(addresses)
+
+        return [
+            cls(name, address, (lat, lon), _skip_validation=True)
+            for name, address, lat, lon in zip(names, addresses, lats.tolist(), lons.tolist())
+        ]
 
-        
-    def _validate_and_assign_address(self, address):
+
+    @staticmethod
+    def validate_addresses(addresses: Iterable[Union[str, dict]]):
         """
-        Validates the address attribute and assigns it if valid.
+        Validates many addresses at once, e.g. before creating properties from a file of listings.
+
+        Strings and None values are skipped with exact type checks, as are the lazily validated addresses
+        created by from_arrays. Every other address is validated with the same rules as the constructor.
 
         Args:
-            address: The proposed address value.
+            addresses (iterable of str or dict): The addresses to validate.
 
         Raises:
-            TypeError: If the address is not a string or dictionary.
-            ValueError: If the address dictionary has invalid keys or value types.
+            TypeError: If an address is not a string or dictionary.
+            ValueError: If an address dictionary has invalid keys or value types.
         """
 
-        valid_address_keys = {
-            "street_number": int,
-            "street_name": str,
-            "unit_number": int,  
-            "city": str,
-            "state": str,
-            "province": str,
-            "region": str,
-            "zip_code": str,
-            "country": str
-        }
-
-        if isinstance(address, str):
-            # Basic validation if only a street address string is provided
-            self.address = address
-        elif isinstance(address, dict):
-            # Validate the dictionary structure
-            if not set(address.keys()).issubset(set(valid_address_keys.keys())):
-                raise ValueError("Address dictionary contains invalid keys")
+        for i, address in enumerate(addresses):
+            address_type = type(address)
+            if address is None or address_type is str or address_type is _AddressProxy:
+                continue
 
-            # Validate value types
-            for key, value in address.items():
-                if key in valid_address_keys and not isinstance(value, valid_address_keys[key]):
-                    raise ValueError(f"Invalid type for address key '{key}'. Expected: {valid_address_keys[key]}, got {type(value)}")
+            try:
+                _validate_address(address)
+            except (TypeError, ValueError) as error:
+                raise type(error)(f"Invalid address at position {i}: {error}") from error
 
-            # Assign the address after validation
-            self.address = address
-        elif address is None:
-            self.address = None
-        else:
-            raise TypeError("Address must be either a string or a dictionary")
 
-            
+    def _validate_and_assign(self, value, name, expected_type, positive=False):
+        """
+        Validates the given value and assigns it to the corresponding attribute.
+
+        Args:
+            value: The value to be assigned to the attribute.
+            name (str): The name of the attribute.
+            expected_type (type): The expected data type of the value.
+            positive (bool, optional): If True, enforces that the value must be positive. Defaults to False.
+
+        Raises:
+            TypeError: If the value is not of the expected type.
+            ValueError: If the 'positive' flag is set and the value is not positive.
+        """
 
+        if not isinstance(value, expected_type) and value is not None:
+            raise TypeError(f"{name} must be of type {expected_type}")
+        if positive and value <= 0:
+            raise ValueError(f"{name} must be positive")
+        setattr(self, name, value)
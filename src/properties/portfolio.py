@@ -0,0 +1,160 @@
+from collections.abc import Mapping
+from typing import Union
+
+import numpy as np
+
+from .base import Property, _VALID_ADDRESS_KEYS
+
+class PropertyPortfolio:
+    """
+    Represents a collection of properties stored as parallel arrays (one array per field),
+    so that portfolio-wide queries run as vectorized comparisons instead of scanning objects.
+    """
+    def __init__(self, capacity: int = 16):
+
+        """
+        Initializes an empty PropertyPortfolio object.
+
+        Args:
+            capacity (int, optional): The number of properties to preallocate space for. The arrays
+            double in size whenever they are full. Defaults to 16.
+        """
+
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("capacity must be a positive integer")
+
+        self._size = 0
+        self._names = np.empty(capacity, dtype=object)
+        self._lats = np.empty(capacity, dtype=np.float64)
+        self._lons = np.empty(capacity, dtype=np.float64)
+        self._addresses = np.empty(capacity, dtype=object)
+        self._address_fields = {key: np.empty(capacity, dtype=object) for key in _VALID_ADDRESS_KEYS}
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    @property
+    def names(self) -> np.ndarray:
+        """The names of the properties."""
+        return self._names[:self._size]
+
+    @property
+    def lats(self) -> np.ndarray:
+        """The latitudes of the properties."""
+        return self._lats[:self._size]
+
+    @property
+    def lons(self) -> np.ndarray:
+        """The longitudes of the properties."""
+        return self._lons[:self._size]
+
+    @property
+    def addresses(self) -> np.ndarray:
+        """The addresses of the properties, as given when they were added."""
+        return self._addresses[:self._size]
+
+
+    def address_field(self, key: str) -> np.ndarray:
+        """
+        Returns the values of one address field for every property.
+
+        Args:
+            key (str): One of the valid address dictionary keys, e.g. "state".
+
+        Returns:
+            np.ndarray: An object array with the value of the field, or None for properties whose
+            address is a string or does not include the field.
+
+        Raises:
+            KeyError: If the key is not a valid address key.
+        """
+
+        return self._address_fields[key][:self._size]
+
+
+    def add(self, name: str, lat: float, lon: float, address: Union[str, dict] = None):
+        """
+        Validates a property and appends it to the portfolio.
+
+        Args:
+            name (str): The name of the property.
+            lat (float): The latitude of the property.
+            lon (float): The longitude of the property.
+            address (str or dict, optional): The address of the property, with the same structure accepted by Property.
+
+        Raises:
+            TypeError: If any of the values has an invalid type.
+            ValueError: If the address is invalid or the latitude or longitude are outside the valid range.
+        """
+
+        self.add_property(Property(name, address, (lat, lon)))
+
+
+    def add_property(self, prop: Property):
+        """
+        Appends an existing property to the portfolio.
+
+        Args:
+            prop (Property): The property to add. It must have a location.
+
+        Raises:
+            ValueError: If the property has no location.
+        """
+
+        if prop.location is None:
+            raise ValueError("Properties in a portfolio must have a location")
+
+        if self._size == len(self._names):
+            self._grow()
+
+        i = self._size
+        self._names[i] = prop.name
+        self._lats[i], self._lons[i] = prop.location
+        self._addresses[i] = prop.address
+
+        is_dict = isinstance(prop.address, Mapping)
+        for key, values in self._address_fields.items():
+            values[i] = prop.address.get(key) if is_dict else None
+
+        self._size += 1
+
+
+    def filter_by_bbox(self, lat_lo: float, lat_hi: float, lon_lo: float, lon_hi: float) -> np.ndarray:
+        """
+        Finds the properties located inside a latitude/longitude bounding box, bounds included.
+
+        Args:
+            lat_lo (float): The minimum latitude.
+            lat_hi (float): The maximum latitude.
+            lon_lo (float): The minimum longitude.
+            lon_hi (float): The maximum longitude.
+
+        Returns:
+            np.ndarray: A boolean mask with one element per property, True for those inside the box.
+        """
+
+        lats = self.lats
+        lons = self.lons
+        return (lats >= lat_lo) & (lats <= lat_hi) & (lons >= lon_lo) & (lons <= lon_hi)
+
+
+    def _grow(self):
+        """
+        Doubles the capacity of every field array.
+        """
+
+        capacity = 2 * len(self._names)
+        self._names = self._resize(self._names, capacity)
+        self._lats = self._resize(self._lats, capacity)
+        self._lons = self._resize(self._lons, capacity)
+        self._addresses = self._resize(self._addresses, capacity)
+        self._address_fields = {key: self._resize(values, capacity) for key, values in self._address_fields.items()}
+
+
+    @staticmethod
+    def _resize(array: np.ndarray, capacity: int) -> np.ndarray:
+        resized = np.empty(capacity, dtype=array.dtype)
+        resized[:len(array)] = array
+        return resized
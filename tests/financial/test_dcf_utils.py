@@ -0,0 +1,281 @@
+import os
+import sys
+
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, path)
+
+import numpy as np
+import pandas as pd
+import pytest
+from src.financial import dcf_utils
+from src.financial.dcf_utils import (
+    DCFModel,
+    create_dataframe,
+    insert_data_into_row,
+    calculate_vacancy,
+    calculate_effective_gross_income,
+    calculate_total_expenses,
+    calculate_net_operating_income,
+    calculate_cash_flow_before_financing,
+    calculate_cash_flow_after_financing,
+    calculate_bottom_lines,
+    replicate_first_column,
+    insert_data_by_year,
+    insert_data_from_dict_list,
+    calculate_scenarios,
+    calculate_debt_service,
+)
+
+ROW_NAMES = [
+    "Gross Revenue",
+    "Vacancy",
+    "Effective Gross Income",
+    "General Operating Expenses",
+    "Real Estate Taxes",
+    "Insurance",
+    "Property Management Fee",
+    "Structural Reserve",
+    "Total Expenses",
+    "Net Operating Income",
+    "Tenant Improvements",
+    "Lease Commissions",
+    "Cash Flow Before Financing",
+    "Debt Service",
+    "Cash Flow After Financing",
+]
+
+# Fixtures for test data
+@pytest.fixture
+def dcf():
+    dcf = DCFModel.from_dataframe(create_dataframe(ROW_NAMES, 2024, 3))
+    insert_data_into_row(dcf, "Gross Revenue", [1000.0, 1100.0, 1200.0])
+    insert_data_into_row(dcf, "General Operating Expenses", [100.0, 110.0, 120.0])
+    insert_data_into_row(dcf, "Real Estate Taxes", [50.0, 55.0, 60.0])
+    insert_data_into_row(dcf, "Insurance", [20.0, 22.0, 24.0])
+    insert_data_into_row(dcf, "Property Management Fee", [30.0, 33.0, 36.0])
+    insert_data_into_row(dcf, "Structural Reserve", [10.0, 11.0, 12.0])
+    insert_data_into_row(dcf, "Tenant Improvements", [5.0, 5.0, 5.0])
+    insert_data_into_row(dcf, "Lease Commissions", [15.0, 15.0, 15.0])
+    insert_data_into_row(dcf, "Debt Service", [300.0, 300.0, 300.0])
+    return dcf
+
+@pytest.fixture
+def rates():
+    rates = DCFModel(["Vacancy Rate"], [2024, 2025, 2026])
+    insert_data_into_row(rates, "Vacancy Rate", [0.05, 0.1, 0.1])
+    return rates
+
+def test_create_dataframe():
+    """Tests that the DataFrame is preallocated as float64 and filled with NaN."""
+    df = create_dataframe(ROW_NAMES, 2024, 3)
+    assert df.shape == (len(ROW_NAMES), 3)
+    assert (df.dtypes == np.float64).all()
+    assert df.isna().all().all()
+    assert list(df.columns) == [2024, 2025, 2026]
+
+def test_model_shape(dcf):
+    """Tests that the model is backed by a (rows, years) float64 array."""
+    assert dcf.values.shape == (len(ROW_NAMES), 3)
+    assert dcf.values.dtype == np.float64
+    assert dcf.row_idx["Vacancy"] == 1
+
+def test_copy(dcf):
+    """Tests that a copy shares the row positions but not the data."""
+    copy = dcf.copy()
+    assert copy.row_idx is dcf.row_idx
+    copy.values[0, 0] = 0.0
+    assert dcf.values[0, 0] == 1000.0
+
+def test_calculations_require_model():
+    """Tests that passing a DataFrame to a calculation raises a TypeError pointing to from_dataframe."""
+    df = create_dataframe(ROW_NAMES, 2024, 3)
+    with pytest.raises(TypeError, match="from_dataframe"):
+        calculate_effective_gross_income(df)
+
+def test_from_dataframe_copies_data():
+    """Tests that the model does not share its data with the DataFrame."""
+    df = create_dataframe(["Gross Revenue"], 2024, 2)
+    dcf = DCFModel.from_dataframe(df)
+    dcf.values[0, 0] = 1.0
+    assert df.isna().all().all()
+
+def test_invalid_values_shape():
+    """Tests that values with a mismatched shape raise a ValueError."""
+    with pytest.raises(ValueError):
+        DCFModel(["Gross Revenue"], [2024, 2025], np.zeros((2, 2)))
+
+def test_insert_data_invalid_length(dcf):
+    """Tests that inserting data with the wrong length raises a ValueError."""
+    with pytest.raises(ValueError):
+        insert_data_into_row(dcf, "Gross Revenue", [1.0, 2.0])
+
+def test_insert_data_into_dataframe_row():
+    """Tests that data is inserted by position into a DataFrame row, ignoring Series labels."""
+    df = create_dataframe(["Gross Revenue", "Insurance"], 2024, 2)
+    insert_data_into_row(df, "Insurance", pd.Series([20.0, 22.0], index=["a", "b"]))
+    np.testing.assert_allclose(df.loc["Insurance"].to_numpy(), [20.0, 22.0])
+    assert df.loc["Gross Revenue"].isna().all()
+
+def test_calculations(dcf, rates):
+    """Tests the full chain of calculations from vacancy to cash flow after financing."""
+    calculate_vacancy(dcf, rates)
+    calculate_effective_gross_income(dcf)
+    calculate_total_expenses(dcf)
+    calculate_net_operating_income(dcf)
+    calculate_cash_flow_before_financing(dcf)
+    calculate_cash_flow_after_financing(dcf)
+
+    result = dcf.to_dataframe()
+    np.testing.assert_allclose(result.loc["Vacancy"], [50.0, 110.0, 120.0])
+    np.testing.assert_allclose(result.loc["Effective Gross Income"], [950.0, 990.0, 1080.0])
+    np.testing.assert_allclose(result.loc["Total Expenses"], [210.0, 231.0, 252.0])
+    np.testing.assert_allclose(result.loc["Net Operating Income"], [740.0, 759.0, 828.0])
+    np.testing.assert_allclose(result.loc["Cash Flow Before Financing"], [720.0, 739.0, 808.0])
+    np.testing.assert_allclose(result.loc["Cash Flow After Financing"], [420.0, 439.0, 508.0])
+
+def test_to_dataframe_labels(dcf):
+    """Tests that the DataFrame view keeps the row names and year columns."""
+    result = dcf.to_dataframe()
+    assert list(result.index) == ROW_NAMES
+    assert list(result.columns) == [2024, 2025, 2026]
+
+def test_calculate_bottom_lines(dcf, rates):
+    """Tests the Total Expenses, Net Operating Income and Cash Flow rows calculated together."""
+    calculate_vacancy(dcf, rates)
+    calculate_effective_gross_income(dcf)
+    calculate_bottom_lines(dcf)
+
+    np.testing.assert_allclose(dcf.values[dcf.row_idx["Total Expenses"]], [210.0, 231.0, 252.0])
+    np.testing.assert_allclose(dcf.values[dcf.row_idx["Net Operating Income"]], [740.0, 759.0, 828.0])
+    np.testing.assert_allclose(dcf.values[dcf.row_idx["Cash Flow Before Financing"]], [720.0, 739.0, 808.0])
+    np.testing.assert_allclose(dcf.values[dcf.row_idx["Cash Flow After Financing"]], [420.0, 439.0, 508.0])
+
+def test_replicate_first_column():
+    """Tests that the first column is replicated into every other column."""
+    df = create_dataframe(["Vacancy Rate", "Growth Rate"], 2024, 3)
+    df.iloc[:, 0] = [0.05, 0.02]
+
+    result = replicate_first_column(df)
+    np.testing.assert_allclose(result.to_numpy(dtype=np.float64), [[0.05] * 3, [0.02] * 3])
+
+    result.iloc[0, 1] = 0.1
+    assert result.iloc[0, 1] == 0.1
+
+def test_replicate_first_column_read_only():
+    """Tests that the read-only replication can be converted into a writeable DCFModel."""
+    df = create_dataframe(["Vacancy Rate"], 2024, 3)
+    df.iloc[:, 0] = [0.05]
+
+    rates = DCFModel.from_dataframe(replicate_first_column(df, writeable=False))
+    rates.values[0, 1] = 0.1
+    np.testing.assert_allclose(rates.values, [[0.05, 0.1, 0.05]])
+
+def test_insert_data_by_year():
+    """Tests that the data of a year is inserted into the matching column."""
+    df = create_dataframe(["Gross Revenue", "Insurance"], 2024, 2)
+    insert_data_by_year(df, {"year": 2025, "Gross Revenue": 1000.0, "Insurance": 20.0})
+    assert df.loc["Gross Revenue", 2025] == 1000.0
+    assert df.loc["Insurance", 2025] == 20.0
+
+def test_insert_data_by_year_invalid_row():
+    """Tests that inserting into a row that does not exist raises a KeyError."""
+    df = create_dataframe(["Gross Revenue"], 2024, 2)
+    with pytest.raises(KeyError):
+        insert_data_by_year(df, {"year": 2024, "Vacancy": 1.0})
+
+def test_insert_data_from_dict_list():
+    """Tests inserting the data of several years from a list of dictionaries."""
+    df = create_dataframe(["Gross Revenue", "Insurance"], 2024, 2)
+    insert_data_from_dict_list(df, [
+        {"year": 2024, "Gross Revenue": 1000.0, "Insurance": 20.0},
+        {"year": 2025, "Gross Revenue": 1100.0},
+    ])
+    np.testing.assert_allclose(df.loc["Gross Revenue"].to_numpy(dtype=np.float64), [1000.0, 1100.0])
+    assert df.loc["Insurance", 2024] == 20.0
+
+def test_calculate_debt_service_no_amortization(dcf):
+    """Tests that zero amortization years give a zero Debt Service row."""
+    calculate_debt_service(dcf, 100000.0, 0.05, 0)
+    np.testing.assert_allclose(dcf.values[dcf.row_idx["Debt Service"]], [0.0, 0.0, 0.0])
+
+def test_calculate_debt_service_invalid_arguments(dcf):
+    """Tests that array loan amounts or rates, and non-integer or out-of-range years or payments, are rejected."""
+    with pytest.raises(TypeError):
+        calculate_debt_service(dcf, np.array([100000.0, 200000.0]), 0.05, 2)
+    with pytest.raises(TypeError):
+        calculate_debt_service(dcf, 100000.0, np.array([0.05, 0.06]), 2)
+    with pytest.raises(TypeError):
+        calculate_debt_service(dcf, 100000.0, 0.05, 2.5)
+    with pytest.raises(ValueError):
+        calculate_debt_service(dcf, 100000.0, 0.05, -1)
+    with pytest.raises(TypeError):
+        calculate_debt_service(dcf, 100000.0, 0.05, 2, payments_per_year=12.0)
+    with pytest.raises(TypeError):
+        calculate_debt_service(dcf, 100000.0, 0.05, 2, payments_per_year=True)
+    with pytest.raises(ValueError):
+        calculate_debt_service(dcf, 100000.0, 0.05, 2, payments_per_year=0)
+
+def test_calculate_scenarios(dcf, rates):
+    """Tests that each scenario matches the result of the calculate_* functions."""
+    vacancy_rates = np.array([[0.05, 0.1, 0.1], [0.0, 0.2, 0.5]])
+    values = np.repeat(dcf.values[None], 2, axis=0)
+
+    calculate_scenarios(values, dcf.row_idx, vacancy_rates)
+
+    for scenario in range(2):
+        insert_data_into_row(rates, "Vacancy Rate", vacancy_rates[scenario])
+        expected = dcf.copy()
+        calculate_vacancy(expected, rates)
+        calculate_effective_gross_income(expected)
+        calculate_bottom_lines(expected)
+        np.testing.assert_allclose(values[scenario], expected.values)
+
+def test_calculate_scenarios_fallback(dcf, monkeypatch):
+    """Tests that the numpy fallback gives the same result as the numba kernel."""
+    vacancy_rates = np.array([[0.05, 0.1, 0.1], [0.0, 0.2, 0.5]])
+    values = np.repeat(dcf.values[None], 2, axis=0)
+    fallback = values.copy()
+
+    calculate_scenarios(values, dcf.row_idx, vacancy_rates)
+    monkeypatch.setattr(dcf_utils, "NUMBA_AVAILABLE", False)
+    calculate_scenarios(fallback, dcf.row_idx, vacancy_rates)
+
+    np.testing.assert_allclose(fallback, values)
+
+def test_calculate_scenarios_row_out_of_range(dcf):
+    """Tests that row positions outside the values array raise a ValueError."""
+    values = np.repeat(dcf.values[None], 2, axis=0)
+    row_idx = dict(dcf.row_idx, **{"Cash Flow After Financing": len(dcf.row_names)})
+    with pytest.raises(ValueError):
+        calculate_scenarios(values, row_idx, np.zeros((2, 3)))
+    row_idx["Cash Flow After Financing"] = -1
+    with pytest.raises(ValueError):
+        calculate_scenarios(values, row_idx, np.zeros((2, 3)))
+
+def test_calculate_scenarios_invalid_shape(dcf):
+    """Tests that vacancy rates with the wrong shape raise a ValueError."""
+    values = np.repeat(dcf.values[None], 2, axis=0)
+    with pytest.raises(ValueError):
+        calculate_scenarios(values, dcf.row_idx, np.zeros((2, 2)))
+
+def test_calculate_vacancy_dataframe_rates(dcf):
+    """Tests that the rates can also be given as a pandas DataFrame."""
+    rates = create_dataframe(["Vacancy Rate"], 2024, 3)
+    rates.iloc[:, 0] = [0.05]
+    calculate_vacancy(dcf, replicate_first_column(rates, writeable=False))
+    np.testing.assert_allclose(dcf.values[dcf.row_idx["Vacancy"]], [50.0, 55.0, 60.0])
+
+def test_calculate_debt_service(dcf):
+    """Tests that the yearly debt service fills the amortization years and is zero afterwards."""
+    calculate_debt_service(dcf, 100000.0, 0.05, 2)
+    monthly_payment = 100000.0 * (0.05 / 12) / (1 - (1 + 0.05 / 12) ** -24)
+    np.testing.assert_allclose(dcf.values[dcf.row_idx["Debt Service"]], [12 * monthly_payment, 12 * monthly_payment, 0.0])
+
+def test_calculate_vacancy_mismatched_years(dcf):
+    """Tests that rates labelled with other years than the model raise a ValueError."""
+    rates = create_dataframe(["Vacancy Rate"], 2030, 3)
+    rates.iloc[:, 0] = [0.05]
+    with pytest.raises(ValueError):
+        calculate_vacancy(dcf, replicate_first_column(rates))
+    with pytest.raises(ValueError):
+        calculate_vacancy(dcf, DCFModel.from_dataframe(replicate_first_column(rates)))
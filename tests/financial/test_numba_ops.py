@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, path)
+
+import numpy as np
+import pytest
+from src.financial import _numba_ops, pmt
+
+def test_pmt_scalar():
+    """Tests the monthly payment of a 30 year mortgage."""
+    assert pmt(0.05 / 12, 360, 100000) == pytest.approx(-536.8216230121399)
+
+def test_pmt_zero_rate():
+    """Tests that a zero interest rate splits the present value evenly across periods."""
+    assert pmt(0.0, 10, 1000) == pytest.approx(-100.0)
+
+def test_pmt_array():
+    """Tests that array arguments are broadcast and match the scalar results."""
+    rates = np.array([[0.0, 0.04 / 12], [0.05 / 12, 0.06 / 12]])
+    result = pmt(rates, 360, 100000)
+    assert result.shape == (2, 2)
+    expected = [[pmt(rate, 360, 100000) for rate in row] for row in rates]
+    np.testing.assert_allclose(result, expected)
+
+def test_pmt_array_without_numba(monkeypatch):
+    """Tests that the numpy array path matches the scalar results."""
+    monkeypatch.setattr(_numba_ops, "NUMBA_AVAILABLE", False)
+    rates = np.array([0.0, 0.04 / 12, 0.05 / 12])
+    result = pmt(rates, np.array([120, 360, 360]), 100000)
+    expected = [pmt(0.0, 120, 100000), pmt(0.04 / 12, 360, 100000), pmt(0.05 / 12, 360, 100000)]
+    np.testing.assert_allclose(result, expected)
+
+def test_pmt_non_positive_nper(monkeypatch):
+    """Tests that a non-positive number of periods raises a ValueError on every path."""
+    with pytest.raises(ValueError):
+        pmt(0.05, 0, 1000)
+    with pytest.raises(ValueError):
+        pmt(np.array([0.05, 0.06]), np.array([10, 0]), 1000)
+    monkeypatch.setattr(_numba_ops, "NUMBA_AVAILABLE", False)
+    with pytest.raises(ValueError):
+        pmt(np.array([0.05, 0.06]), np.array([10, -1]), 1000)
+
+def test_numba_imported_lazily():
+    """Tests that importing src.financial does not import numba."""
+    code = "import sys, src.financial; print('numba' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=path, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -5,8 +5,18 @@ path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
 sys.path.insert(0, path)
 
 import pytest
+from src.properties import base
 from src.properties.base import Property
 
+def _lonlat_oob_implementations():
+    implementations = [pytest.param(base._lonlat_oob_py, id="python")]
+    try:
+        from src.properties._geo import lonlat_oob
+        implementations.append(pytest.param(lonlat_oob, id="cython"))
+    except ImportError:
+        implementations.append(pytest.param(None, id="cython", marks=pytest.mark.skip(reason="Cython extension not built")))
+    return implementations
+
 # Fixtures for test data
 @pytest.fixture
 def valid_location():
@@ -83,4 +93,114 @@ def test_address_invalid_keys(address_invalid_keys):
 def test_address_invalid_value_type(address_invalid_value_type):
     """Tests that providing address values with invalid types raises a ValueError."""
     with pytest.raises(ValueError):
-        Property(name="Test Property", address=address_invalid_value_type)
\ No newline at end of file
+        Property(name="Test Property", address=address_invalid_value_type)
+
+def test_from_arrays(valid_address_dict):
+    """Tests bulk creation of properties from parallel arrays."""
+    props = Property.from_arrays(["A", "B"], [valid_address_dict, "1 Main St"], [40.7128, -33.45], [-74.0060, -70.66])
+    assert len(props) == 2
+    assert props[0].name == "A"
+    assert props[0].address == valid_address_dict
+    assert props[0].location == (40.7128, -74.0060)
+    assert props[1].location == (-33.45, -70.66)
+
+def test_from_arrays_without_addresses():
+    """Tests that the addresses array is optional."""
+    props = Property.from_arrays(["A"], None, [10.0], [20.0])
+    assert props[0].address is None
+
+def test_from_arrays_invalid_location():
+    """Tests that an out-of-range latitude or longitude in the arrays raises a ValueError."""
+    with pytest.raises(ValueError):
+        Property.from_arrays(["A", "B"], None, [10.0, 91.0], [20.0, 20.0])
+    with pytest.raises(ValueError):
+        Property.from_arrays(["A", "B"], None, [10.0, 10.0], [20.0, float("nan")])
+
+def test_from_arrays_non_numeric_location():
+    """Tests that string coordinates raise a TypeError, as in the constructor."""
+    with pytest.raises(TypeError):
+        Property.from_arrays(["A"], None, ["40.7"], ["-74"])
+    with pytest.raises(TypeError):
+        Property.from_arrays(["A"], None, [40.7], [None])
+
+def test_from_arrays_mismatched_lengths():
+    """Tests that arrays of different lengths raise a ValueError."""
+    with pytest.raises(ValueError):
+        Property.from_arrays(["A", "B"], None, [10.0], [20.0])
+
+def test_slots(valid_location):
+    """Tests that Property instances store their attributes in slots instead of a __dict__."""
+    prop = Property(name="Test Property", location=valid_location)
+    assert not hasattr(prop, "__dict__")
+    with pytest.raises(AttributeError):
+        prop.neighborhood = "Neighborhood 1"
+
+def test_invalid_location_value_types(valid_address_dict):
+    """Tests that non-numeric latitude or longitude values raise a TypeError."""
+    with pytest.raises(TypeError):
+        Property(name="Test Property", location=("40.7128", -74.0060), address=valid_address_dict)
+    with pytest.raises(TypeError):
+        Property(name="Test Property", location=(40.7128, None), address=valid_address_dict)
+
+def test_non_finite_location():
+    """Tests that NaN or infinite coordinates raise a ValueError."""
+    with pytest.raises(ValueError):
+        Property(name="Test Property", location=(float("nan"), 0.0))
+    with pytest.raises(ValueError):
+        Property(name="Test Property", location=(0.0, float("inf")))
+
+def test_validate_addresses(valid_address_dict):
+    """Tests that a list of valid addresses passes the bulk validation."""
+    Property.validate_addresses([valid_address_dict, "1 Main St", None, {"country": "Chile"}])
+
+def test_validate_addresses_subclasses(valid_address_dict):
+    """Tests that subclasses of str and dict are accepted, as in the constructor."""
+    class AddressDict(dict):
+        pass
+
+    class AddressStr(str):
+        pass
+
+    Property.validate_addresses([AddressDict(valid_address_dict), AddressStr("1 Main St")])
+
+def test_validate_addresses_invalid(valid_address_dict, address_invalid_keys, address_invalid_value_type, invalid_address_type):
+    """Tests that the bulk validation raises the same errors as the constructor."""
+    with pytest.raises(ValueError, match="position 1"):
+        Property.validate_addresses([valid_address_dict, address_invalid_keys])
+    with pytest.raises(ValueError):
+        Property.validate_addresses([address_invalid_value_type])
+    with pytest.raises(TypeError):
+        Property.validate_addresses(["1 Main St", invalid_address_type])
+
+def test_from_arrays_invalid_address(address_invalid_keys):
+    """Tests that invalid addresses in the arrays raise a ValueError."""
+    with pytest.raises(ValueError):
+        Property.from_arrays(["A"], [address_invalid_keys], [10.0], [20.0])
+
+def test_from_arrays_lazy_addresses(valid_address_dict, address_invalid_keys):
+    """Tests that lazy addresses are only validated when accessed."""
+    props = Property.from_arrays(["A", "B"], [valid_address_dict, address_invalid_keys], [10.0, 10.0], [20.0, 20.0],
+                                 lazy_addresses=True)
+    assert props[0].address == valid_address_dict
+    assert props[0].address["city"] == "New York"
+    with pytest.raises(ValueError):
+        props[1].address["city"]
+
+
+@pytest.mark.parametrize("lonlat_oob", _lonlat_oob_implementations())
+def test_lonlat_oob(lonlat_oob):
+    """Tests that the Python and Cython bounds checks agree."""
+    assert not lonlat_oob(0, 0)
+    assert not lonlat_oob(-90, 180)
+    assert not lonlat_oob(90.0, -180.0)
+    assert lonlat_oob(90.5, 0)
+    assert lonlat_oob(0, -180.5)
+    assert lonlat_oob(float("nan"), 0)
+    assert lonlat_oob(0, float("inf"))
+    with pytest.raises(OverflowError):
+        lonlat_oob(10**400, 0)
+
+def test_overflowing_location():
+    """Tests that an integer too large for a float raises a ValueError."""
+    with pytest.raises(ValueError):
+        Property(name="Test Property", location=(10**400, 0))
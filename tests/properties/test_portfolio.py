@@ -0,0 +1,52 @@
+import os
+import sys
+
+path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../'))
+sys.path.insert(0, path)
+
+import numpy as np
+import pytest
+from src.properties.base import Property
+from src.properties.portfolio import PropertyPortfolio
+
+# Fixtures for test data
+@pytest.fixture
+def portfolio():
+    portfolio = PropertyPortfolio(capacity=2)
+    portfolio.add("New York", 40.7128, -74.0060, {"city": "New York", "state": "NY"})
+    portfolio.add("Los Angeles", 34.0522, -118.2437, {"city": "Los Angeles", "state": "CA"})
+    portfolio.add("San Francisco", 37.7749, -122.4194, {"city": "San Francisco", "state": "CA"})
+    portfolio.add("Santiago", -33.4489, -70.6693, "Av. Providencia 1234")
+    return portfolio
+
+def test_add_grows_arrays(portfolio):
+    """Tests that adding beyond the initial capacity keeps every property."""
+    assert len(portfolio) == 4
+    assert list(portfolio.names) == ["New York", "Los Angeles", "San Francisco", "Santiago"]
+    np.testing.assert_allclose(portfolio.lats, [40.7128, 34.0522, 37.7749, -33.4489])
+
+def test_filter_by_bbox(portfolio):
+    """Tests that the bounding box mask selects the properties inside it."""
+    mask = portfolio.filter_by_bbox(30, 41, -125, -100)
+    assert list(portfolio.names[mask]) == ["Los Angeles", "San Francisco"]
+
+def test_address_field(portfolio):
+    """Tests querying an address field across the portfolio."""
+    assert list(portfolio.address_field("state")) == ["NY", "CA", "CA", None]
+    assert (portfolio.address_field("state") == "CA").sum() == 2
+
+def test_add_property(portfolio):
+    """Tests appending an existing Property object."""
+    portfolio.add_property(Property(name="Test Property", location=(10.0, 20.0)))
+    assert portfolio.names[-1] == "Test Property"
+    assert portfolio.addresses[-1] is None
+
+def test_add_invalid_location(portfolio):
+    """Tests that an out-of-range latitude raises a ValueError."""
+    with pytest.raises(ValueError):
+        portfolio.add("Invalid", 100.0, 0.0)
+
+def test_add_property_without_location(portfolio):
+    """Tests that a property without a location raises a ValueError."""
+    with pytest.raises(ValueError):
+        portfolio.add_property(Property(name="Test Property"))